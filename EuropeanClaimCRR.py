@@ -1,7 +1,8 @@
+import math
 import numpy as np
 import scipy.special
-from scipy.stats import binom
 import matplotlib.pyplot as plt
+from numba import njit, prange
 
 class EuropeanClaimCRR:
     """
@@ -21,13 +22,37 @@ class EuropeanClaimCRR:
             down (float mit down < interestRate): Die Rendite für das Szenario, dass der Preis eines Assets fällt.
         
         Returns:
-            Array: Der Array enthält zwei Einträge des Datentyps float, die größer als 0 sind und kleiner als 1.
+            Tupel: Das Tupel enthält zwei Einträge des Datentyps float, die größer als 0 sind und kleiner als 1.
             Der erste Eintrag beinhaltet die Wahrscheinlichkeit für einen Up, der zweite für einen Down.
         """
     
         probabilityUp = (interestRate - down) / (up - down)
         probabilityDown = 1.0 - probabilityUp
-        return [probabilityUp, probabilityDown]
+        return probabilityUp, probabilityDown
+    
+    def calcBinomialWeights(self, maturity, probUp):
+        """
+        Die Methode berechnet die Wahrscheinlichkeiten der Binomialverteilung für 0 bis maturity Ups. Die
+        Wahrscheinlichkeiten werden in einem Schritt über den Logarithmus (scipy.special.gammaln) berechnet. So
+        entsteht auch für lange Laufzeiten kein Unterlauf wie bei (1 - probUp) ** maturity.
+        
+        Args:
+            maturity (int größer 0): Laufzeit des Claims.
+            probUp (float bzw. Array mit floats größer 0 und kleiner 1): Wahrscheinlichkeit für einen Up
+            (vgl. calcMartingalMeasure).
+        
+        Returns:
+            Array: Der Array enthält maturity + 1 Einträge des Datentyps float. Der Eintrag k beinhaltet die
+            Wahrscheinlichkeit für genau k Ups. Wird für probUp ein Array übergeben, hat das Ergebnis die Form
+            (maturity + 1,) + probUp.shape.
+        """
+        
+        probUp = np.asarray(probUp)
+        numberUps = np.arange(maturity + 1).reshape((-1,) + (1,) * probUp.ndim)
+        numberDowns = maturity - numberUps
+        logBinom = (scipy.special.gammaln(maturity + 1) - scipy.special.gammaln(numberUps + 1)
+                    - scipy.special.gammaln(numberDowns + 1))
+        return np.exp(logBinom + scipy.special.xlogy(numberUps, probUp) + scipy.special.xlog1py(numberDowns, -probUp))
 
 class CallOption(EuropeanClaimCRR):
     
@@ -36,16 +61,17 @@ class CallOption(EuropeanClaimCRR):
         Die Methode berechnet die Auszahlung einer europäischen Call-Option.
         
         Args:
-            assetPrice (float größer 0): Preis des Assets.
+            assetPrice (float größer 0 oder Array mit floats größer 0): Preis des Assets. Wird ein Array
+            übergeben, wird die Auszahlung für jeden Eintrag berechnet.
             strike (float größer 0): Parameter einer europäischen Call-Option und bestimmt die Schranke, 
             ab welcher eine Auszahlung stattfindet.
         
         Returns:
-            Float (größer/gleich 0): Die Auszahlung für den Eigentümer einer Europäischen Call-Option nach
+            Float bzw. Array (größer/gleich 0): Die Auszahlung für den Eigentümer einer Europäischen Call-Option nach
             Ablauf der Laufzeit.
         """
         
-        return max(assetPrice - strike,0)
+        return np.maximum(assetPrice - strike, 0.0)
     
     def calcPrice(self, interestRate, up, down, maturity, startPrice, strike):
         """
@@ -68,14 +94,12 @@ class CallOption(EuropeanClaimCRR):
         
         upReturn = 1.0 + up
         downReturn = 1.0 + down
-        expectedValue = 0.0
         probUp = super().calcMartingalMeasure(interestRate, up, down)[0]
         
-        for numberUps in range(maturity):
-            numberDowns = maturity - numberUps
-            scenarioReturn = (upReturn ** numberUps) * (downReturn ** numberDowns)
-            pay = self.payoff(startPrice * scenarioReturn, strike)
-            expectedValue = expectedValue + binom.pmf(numberUps, maturity, probUp) * pay
+        stepRatios = np.full(maturity, upReturn / downReturn)
+        scenarioReturns = (downReturn ** maturity) * np.cumprod(np.r_[1.0, stepRatios])
+        pays = self.payoff(startPrice * scenarioReturns, strike)
+        expectedValue = float(pays @ self.calcBinomialWeights(maturity, probUp))
         return expectedValue / ((1.0 + interestRate) ** maturity)
 
 class PutOption(EuropeanClaimCRR):
@@ -84,16 +108,17 @@ class PutOption(EuropeanClaimCRR):
         Die Methode berechnet die Auszahlung einer europäischen Put-Option.
         
         Args:
-            assetPrice (float größer 0): Preis des Assets.
+            assetPrice (float größer 0 oder Array mit floats größer 0): Preis des Assets. Wird ein Array
+            übergeben, wird die Auszahlung für jeden Eintrag berechnet.
             strike (float größer 0): Parameter einer europäischen Put-Option und bestimmt die Schranke, 
             ab welcher eine Auszahlung stattfindet.
         
         Returns:
-            Float (größer/gleich 0): Die Auszahlung für den Eigentümer einer Europäischen Put-Option nach
+            Float bzw. Array (größer/gleich 0): Die Auszahlung für den Eigentümer einer Europäischen Put-Option nach
             Ablauf der Laufzeit.
         """
         
-        return max(strike - assetPrice,0)
+        return np.maximum(strike - assetPrice, 0.0)
     
     def calcPrice(self, interestRate, up, down, maturity, startPrice, strike):
         """
@@ -116,16 +141,62 @@ class PutOption(EuropeanClaimCRR):
         
         upReturn = 1.0 + up
         downReturn = 1.0 + down
-        expectedValue = 0.0
         probUp = super().calcMartingalMeasure(interestRate, up, down)[0]
         
-        for numberUps in range(maturity):
-            numberDowns = maturity - numberUps
-            scenarioReturn = (upReturn ** numberUps) * (downReturn ** numberDowns)
-            pay = self.payoff(startPrice * scenarioReturn, strike)
-            expectedValue = expectedValue + binom.pmf(numberUps, maturity, probUp) * pay
+        stepRatios = np.full(maturity, upReturn / downReturn)
+        scenarioReturns = (downReturn ** maturity) * np.cumprod(np.r_[1.0, stepRatios])
+        pays = self.payoff(startPrice * scenarioReturns, strike)
+        expectedValue = float(pays @ self.calcBinomialWeights(maturity, probUp))
         return expectedValue / ((1.0 + interestRate) ** maturity)
 
+@njit(fastmath=True, cache=True)
+def _calcSums(probUp, up, maturity, startPrice, strike, barriere, limit):
+    """
+    Numerischer Kern von UICallOption.calcPriceSums. Die Funktion wird mit numba kompiliert und berechnet beide
+    Summanden in einem Durchlauf; die Endpreise werden in der Schleife fortgeschrieben (keine Potenzen pro Schritt).
+    Die Wahrscheinlichkeiten werden wie in EuropeanClaimCRR.calcBinomialWeights über den Logarithmus berechnet
+    (math.lgamma), damit für lange Laufzeiten kein Unterlauf entsteht. Die Barrieren gehen als Maske in die Summen
+    ein, die Schleife enthält keine Verzweigung. Die Masken vergleichen den ganzzahligen Exponenten
+    2 * numberUps - maturity mit limit (dem Ergebnis von UICallOption.barrierLimits), da die Barriere auf einem
+    Knoten liegt und ein Vergleich der Endpreise an Rundungsfehlern scheitern würde.
+    """
+    
+    upReturn = 1.0 + up
+    ratio = probUp / (1.0 - probUp)
+    logProbUp = math.log(probUp)
+    logProbDown = math.log1p(-probUp)
+    logFactorial = math.lgamma(maturity + 1.0)
+    endPrice = startPrice * (upReturn ** (-maturity))
+    tempStrike = strike * (upReturn ** (- 2.0 * limit))
+    sum1 = 0.0
+    sum2 = 0.0
+    
+    for numberUps in range(maturity + 1):
+        numberDowns = maturity - numberUps
+        pmf = math.exp(logFactorial - math.lgamma(numberUps + 1.0) - math.lgamma(numberDowns + 1.0)
+                       + numberUps * logProbUp + numberDowns * logProbDown)
+        exponent = 2 * numberUps - maturity
+        sum1 = sum1 + (exponent >= limit) * max(endPrice - strike, 0.0) * pmf
+        sum2 = sum2 + (exponent < -limit) * max(endPrice - tempStrike, 0.0) * pmf
+        endPrice = endPrice * upReturn * upReturn
+    
+    return sum1, (ratio ** limit) * ((barriere / startPrice) ** 2.0) * sum2
+
+@njit(parallel=True, cache=True)
+def _calcPrices(interestRates, up, down, maturities, startPrice, strikes, barrieres, limits):
+    """
+    Numerischer Kern von UICallOption.calcPriceSweep. Für jedes Szenario i (alle Arrays haben dieselbe Länge)
+    wird der Preis wie in UICallOption.calcPrice berechnet; die Szenarien werden mit prange auf mehrere Kerne
+    verteilt. Der Array limits entspricht dem Ergebnis von UICallOption.barrierLimits.
+    """
+    
+    prices = np.empty(len(maturities))
+    for i in prange(len(maturities)):
+        probUp = (interestRates[i] - down) / (up - down)
+        sum1, sum2 = _calcSums(probUp, up, maturities[i], startPrice, strikes[i], barrieres[i], limits[i])
+        prices[i] = (sum1 + sum2) / ((1.0 + interestRates[i]) ** maturities[i])
+    return prices
+
 class UICallOption(EuropeanClaimCRR):
     
     def payoff(self, assetPrices, strike, barriere):
@@ -146,7 +217,7 @@ class UICallOption(EuropeanClaimCRR):
         """
         
         if self.checkBarriere(assetPrices, barriere):
-            return max(assetPrices[len(assetPrices)] - strike,0)
+            return max(assetPrices[-1] - strike,0)
         else:
             return 0
     
@@ -164,78 +235,69 @@ class UICallOption(EuropeanClaimCRR):
             Boolean: Der Default-Wert ist False. Wurde die Barriere einmal erreicht, wird der Wert auf True gesetzt.
         """
         
-        check = False
-        for time in range(len(assetPrices)):
-            if assetPrices[time] >= barriere:
-                check = True
-                break
-        return check
+        return bool(np.any(np.asarray(assetPrices) >= barriere))
     
     def barrierLimits(self, up, maturity, startPrice, barriere):
         """
         Die Methode berechnet die Anzahl der Ups, die notwendig ist, damit ein Asset den Wert der Barriere annimmt
         (Downs gibt es nicht). Wichtig ist, dass die Parameter entsprechend gewählt werden, damit das möglich ist
-        (das ist eine Voraussetzung des Modells). Aktuell werden ungünstige Parameter nicht abgefangen. Dies ist unbedingt
-        vom Anwender zu berücksichtigen (Fehler werden grundsätzlich in keiner Klasse abgefangen). Der Wert wird für
-        das Pricing des Derivates benötigt.
+        (das ist eine Voraussetzung des Modells). Die Anzahl wird direkt über den Logarithmus berechnet; liegt die
+        Barriere nicht auf einem Knoten, schlägt lediglich eine Assertion fehl. Darüber hinaus werden ungünstige
+        Parameter nicht abgefangen. Dies ist unbedingt vom Anwender zu berücksichtigen (Fehler werden grundsätzlich
+        in keiner Klasse abgefangen). Der Wert wird für das Pricing des Derivates benötigt.
         
         Args:
             up (float mit interestRate < up): Die Rendite für das Szenario, dass der Preis eines Assets steigt.
             maturity (int größer 0): Laufzeit der Put-Option.
             startPrice (float größer 0): Startpreis des Assets.
-            barriere (float größer strike): Die Barriere ist eine Schranke, die einmal (bevor die Laufzeit
-            endet) erreicht werden muss, damit grundsätzlich die Möglichkeit einer Auszahlung besteht.
+            barriere (float bzw. Array mit floats größer strike): Die Barriere ist eine Schranke, die einmal (bevor
+            die Laufzeit endet) erreicht werden muss, damit grundsätzlich die Möglichkeit einer Auszahlung besteht.
         
         Returns:
-            Int (größer 0): Die Anzahl der Ups, die notwendig ist, damit ein Asset den Wert der Barriere annimmt
-        (Downs gibt es nicht).
+            Int bzw. Array mit ints (größer 0): Die Anzahl der Ups, die notwendig ist, damit ein Asset den Wert der
+        Barriere annimmt (Downs gibt es nicht).
         """
         
-        upReturn = 1.0 + up
-        for numberUps in range(maturity):
-            if barriere == startPrice * (upReturn ** numberUps):
-                limit = numberUps
-                break
-        return limit
+        if np.ndim(barriere) == 0:
+            limit = int(round(math.log(barriere / startPrice) / math.log1p(up)))
+            assert math.isclose(startPrice * ((1.0 + up) ** limit), barriere)
+            return limit
+        
+        limits = np.rint(np.log(np.asarray(barriere) / startPrice) / np.log1p(up)).astype(np.int64)
+        assert np.allclose(startPrice * ((1.0 + up) ** limits), barriere, rtol=1e-09, atol=0.0)
+        return limits
     
-    def calcPriceSum1(self, interestRate, up, down, maturity, startPrice, strike, barriere):
+    def calcPriceSums(self, probUp, up, maturity, startPrice, strike, barriere, limit):
         """
         Für die Berechnung des Preises (im arbitragefreien CRR-Modell) müssen zwei Summanden berechnet
-        werden. Präziser müssen zwei Erwartungswerte für bestimmte Szenarien berechnet werden (hier
-        ist der Endwert des Assets größer oder gleich der Barriere).
+        werden. Präziser müssen zwei Erwartungswerte für bestimmte Szenarien berechnet werden (im ersten
+        ist der Endwert des Assets größer oder gleich der Barriere, im zweiten kleiner als die Barriere).
+        Beide Summanden werden in einem Durchlauf über die Knoten berechnet.
         
         Args:
-            interestRate (float größer -1): "Risikoloser" Zins (z.B. für ein Tagesgeldkonto)
+            probUp (float größer 0 und kleiner 1): Wahrscheinlichkeit für einen Up (vgl. calcMartingalMeasure).
             up (float mit interestRate < up): Die Rendite für das Szenario, dass der Preis eines Assets steigt.
-            down (float mit down < interestRate): Die Rendite für das Szenario, dass der Preis eines Assets fällt.
             maturity (int größer 0): Laufzeit der Put-Option.
             startPrice (float größer 0): Startpreis des Assets.
             strike (float größer 0): Bestimmt die Schranke, ab welcher eine Auszahlung stattfindet (falls die
             Barriere erreicht wird).
             barriere (float größer strike): Die Barriere ist eine Schranke, die einmal (bevor die Laufzeit
             endet) erreicht werden muss, damit grundsätzlich die Möglichkeit einer Auszahlung besteht.
+            limit (int größer/gleich 0): Die Anzahl der Ups, die notwendig ist, damit ein Asset den Wert der
+            Barriere annimmt (vgl. barrierLimits).
         
         Returns:
-            Float (größer/gleich 0): Ein Summand für die Berechnung des (arbitragefreien) Preises für eine
-            Up & In Call-Option zum gegenwärtigen Zeitpunkt.
+            Tupel: Die beiden Summanden (floats größer/gleich 0) für die Berechnung des (arbitragefreien) Preises
+            für eine Up & In Call-Option zum gegenwärtigen Zeitpunkt.
         """
         
-        upReturn = 1.0 + up
-        sum1 = 0.0
-        probUp = super().calcMartingalMeasure(interestRate, up, down)[0]
-        
-        for numberUps in range(maturity):
-            endPrice = startPrice * (upReturn ** (2.0 * numberUps - maturity))
-            if endPrice >= barriere:
-                sum1 = sum1 + max(endPrice - strike, 0) * binom.pmf(numberUps, maturity, probUp)
-        
-        return sum1
+        #Python-Floats statt NumPy-Skalaren: numba kompiliert den Kern so nur für eine Signatur
+        return _calcSums(float(probUp), float(up), int(maturity), float(startPrice), float(strike), float(barriere),
+                         int(limit))
     
-    def calcPriceSum2(self, interestRate, up, down, maturity, startPrice, strike, barriere):
+    def calcPrice(self, interestRate, up, down, maturity, startPrice, strike, barriere):
         """
-        Für die Berechnung des Preises (im arbitragefreien CRR-Modell) müssen zwei Summanden berechnet
-        werden. Präziser müssen zwei Erwartungswerte für bestimmte Szenarien berechnet werden (hier
-        ist der Endwert des Assets kleiner als die Barriere).
+        Die Methode berechnet den arbitragefreien Preis für eine Up & In Call-Option im CRR-Modell.
         
         Args:
             interestRate (float größer -1): "Risikoloser" Zins (z.B. für ein Tagesgeldkonto)
@@ -249,60 +311,106 @@ class UICallOption(EuropeanClaimCRR):
             endet) erreicht werden muss, damit grundsätzlich die Möglichkeit einer Auszahlung besteht.
         
         Returns:
-            Float (größer/gleich 0): Ein Summand für die Berechnung des (arbitragefreien) Preises für eine
-            Up & In Call-Option zum gegenwärtigen Zeitpunkt.
+            Float (größer/gleich 0): Der (arbitragefreie) Preis für eine Up & In Call-Option zum gegenwärtigen Zeitpunkt
+            im CRR-Modell.
         """
         
-        upReturn = 1.0 + up
-        sum2 = 0.0
+        interestRate = float(interestRate)
         probUp = super().calcMartingalMeasure(interestRate, up, down)[0]
         limit = self.barrierLimits(up, maturity, startPrice, barriere)
-        tempStrike = strike * (upReturn ** (- 2.0 * limit))
-        tempBarriere = (startPrice**2) / barriere
-        for numberUps in range(maturity):
-            endPrice = startPrice * (upReturn ** (2.0 * numberUps - maturity))
-            if endPrice < tempBarriere:
-                sum2 = sum2 + max(endPrice - tempStrike, 0) * binom.pmf(numberUps, maturity, probUp)
-        return ((probUp / (1.0 - probUp)) ** limit) * ((barriere / startPrice) ** 2.0) * sum2
+        sum1, sum2 = self.calcPriceSums(probUp, up, maturity, startPrice, strike, barriere, limit)
+        diskont = (1.0 + interestRate) ** maturity
+        
+        return (sum1 + sum2) / diskont
     
-    def calcPrice(self, interestRate, up, down, maturity, startPrice, strike, barriere):
+    def calcPriceBatch(self, interestRate, up, down, maturity, startPrice, strike, barriere, dtype=np.float64):
         """
-        Die Methode berechnet den arbitragefreien Preis für eine Up & In Call-Option im CRR-Modell.
+        Die Methode berechnet wie calcPrice den arbitragefreien Preis für eine Up & In Call-Option im CRR-Modell,
+        allerdings für viele Szenarien auf einmal. Für interestRate, strike und barriere können Arrays übergeben
+        werden (NumPy-Broadcasting). Endpreise und Wahrscheinlichkeiten werden nur einmal berechnet.
         
         Args:
-            interestRate (float größer -1): "Risikoloser" Zins (z.B. für ein Tagesgeldkonto)
+            interestRate (float bzw. Array mit floats größer -1): "Risikoloser" Zins (z.B. für ein Tagesgeldkonto)
             up (float mit interestRate < up): Die Rendite für das Szenario, dass der Preis eines Assets steigt.
             down (float mit down < interestRate): Die Rendite für das Szenario, dass der Preis eines Assets fällt.
             maturity (int größer 0): Laufzeit der Put-Option.
             startPrice (float größer 0): Startpreis des Assets.
-            strike (float größer 0): Bestimmt die Schranke, ab welcher eine Auszahlung stattfindet (falls die
-            Barriere erreicht wird).
-            barriere (float größer strike): Die Barriere ist eine Schranke, die einmal (bevor die Laufzeit
-            endet) erreicht werden muss, damit grundsätzlich die Möglichkeit einer Auszahlung besteht.
+            strike (float bzw. Array mit floats größer 0): Bestimmt die Schranke, ab welcher eine Auszahlung
+            stattfindet (falls die Barriere erreicht wird).
+            barriere (float bzw. Array mit floats größer strike): Die Barriere ist eine Schranke, die einmal (bevor
+            die Laufzeit endet) erreicht werden muss, damit grundsätzlich die Möglichkeit einer Auszahlung besteht.
+            dtype (NumPy-Datentyp): Genauigkeit, in der die Summen über die Knoten berechnet werden. Für Plots
+            reicht np.float32 (halber Speicherbedarf); der Default np.float64 entspricht der Genauigkeit von calcPrice.
         
         Returns:
-            Float (größer/gleich 0): Der (arbitragefreie) Preis für eine Up & In Call-Option zum gegenwärtigen Zeitpunkt
-            im CRR-Modell.
+            Array (größer/gleich 0): Die (arbitragefreien) Preise für die Up & In Call-Optionen zum gegenwärtigen
+            Zeitpunkt im CRR-Modell. Die Form entspricht der gemeinsamen (Broadcast-)Form von interestRate, strike
+            und barriere, der Datentyp dem Parameter dtype.
         """
         
-        sum1 = self.calcPriceSum1(interestRate, up, down, maturity, startPrice, strike, barriere)
-        sum2 = self.calcPriceSum2(interestRate, up, down, maturity, startPrice, strike, barriere)
-        diskont = (1.0 + interestRate) ** maturity
+        shape = np.broadcast(interestRate, strike, barriere).shape
+        interestRates, strikes, barrieres = (np.broadcast_to(np.asarray(x, dtype=float), shape).ravel()
+                                             for x in (interestRate, strike, barriere))
+        upReturn = 1.0 + up
+        exponents = (2 * np.arange(maturity + 1) - maturity)[:, None]
+        endPrices = (startPrice * (upReturn ** exponents.astype(np.float64))).astype(dtype)
+        
+        probUp = super().calcMartingalMeasure(interestRates, up, down)[0]
+        #Diskontierung direkt in die Gewichte, damit die Summen bereits Barwerte sind
+        diskont = (1.0 + interestRates) ** maturity
+        pmf = (self.calcBinomialWeights(maturity, probUp) / diskont).astype(dtype)
+        limits = self.barrierLimits(up, maturity, startPrice, barrieres)
+        tempStrikes = (strikes * (upReturn ** (- 2.0 * limits))).astype(dtype)
+        
+        #Masken über den ganzzahligen Exponenten (wie in _calcSums), nicht über einen Vergleich der Endpreise
+        pays1 = np.maximum(endPrices - strikes.astype(dtype), 0.0) * (exponents >= limits)
+        pays2 = np.maximum(endPrices - tempStrikes, 0.0) * (exponents < -limits)
+        sum1 = np.einsum("kn,kn->n", pmf, pays1)
+        sum2 = np.einsum("kn,kn->n", pmf, pays2)
+        sum2 = ((probUp / (1.0 - probUp)) ** limits) * ((barrieres / startPrice) ** 2.0) * sum2
+        
+        return (sum1 + sum2).astype(dtype).reshape(shape)
+    
+    def calcPriceSweep(self, interestRate, up, down, maturity, startPrice, strike, barriere):
+        """
+        Die Methode berechnet wie calcPrice den arbitragefreien Preis für eine Up & In Call-Option im CRR-Modell
+        für viele Szenarien. Anders als bei calcPriceBatch kann auch maturity ein Array sein; für interestRate,
+        maturity, strike und barriere können Arrays übergeben werden (NumPy-Broadcasting). Die Szenarien werden
+        parallel berechnet.
         
-        return (sum1 + sum2) / diskont
+        Args:
+            interestRate (float bzw. Array mit floats größer -1): "Risikoloser" Zins (z.B. für ein Tagesgeldkonto)
+            up (float mit interestRate < up): Die Rendite für das Szenario, dass der Preis eines Assets steigt.
+            down (float mit down < interestRate): Die Rendite für das Szenario, dass der Preis eines Assets fällt.
+            maturity (int bzw. Array mit ints größer 0): Laufzeit der Put-Option.
+            startPrice (float größer 0): Startpreis des Assets.
+            strike (float bzw. Array mit floats größer 0): Bestimmt die Schranke, ab welcher eine Auszahlung
+            stattfindet (falls die Barriere erreicht wird).
+            barriere (float bzw. Array mit floats größer strike): Die Barriere ist eine Schranke, die einmal (bevor
+            die Laufzeit endet) erreicht werden muss, damit grundsätzlich die Möglichkeit einer Auszahlung besteht.
+        
+        Returns:
+            Array (größer/gleich 0): Die (arbitragefreien) Preise für die Up & In Call-Optionen zum gegenwärtigen
+            Zeitpunkt im CRR-Modell. Die Form entspricht der gemeinsamen (Broadcast-)Form von interestRate,
+            maturity, strike und barriere.
+        """
+        
+        shape = np.broadcast(interestRate, maturity, strike, barriere).shape
+        interestRates, strikes, barrieres = (np.broadcast_to(x, shape).astype(np.float64).ravel()
+                                             for x in (interestRate, strike, barriere))
+        maturities = np.broadcast_to(maturity, shape).astype(np.int64).ravel()
+        limits = self.barrierLimits(up, maturities, startPrice, barrieres)
+        prices = _calcPrices(interestRates, float(up), float(down), maturities, float(startPrice), strikes, barrieres,
+                             limits)
+        
+        return prices.reshape(shape)
 
 if __name__ == "__main__":
     #Maturity-Preis
     option = UICallOption()
-    maturities = []
-    prices1 = []
-    prices2 = []
-    prices3 = []
-    for i in range(4, 100):
-        maturities.append(i)
-        prices1.append(option.calcPrice(-0.25, 1.0, -0.5, i, 1, 1, 8))
-        prices2.append(option.calcPrice(0.0, 1.0, -0.5, i, 1, 1, 8))
-        prices3.append(option.calcPrice(0.25, 1.0, -0.5, i, 1, 1, 8))
+    maturities = np.arange(4, 100)
+    rates = np.array([[-0.25], [0.0], [0.25]])
+    prices1, prices2, prices3 = option.calcPriceSweep(rates, 1.0, -0.5, maturities, 1, 1, 8)
     
     plt.plot(maturities, prices1, label="Zins=-0.25")
     plt.plot(maturities, prices2, label="Zins=0.0")
@@ -316,15 +424,9 @@ if __name__ == "__main__":
     
     #Barrier-Preis
     option = UICallOption()
-    barrier = []
-    prices1 = []
-    prices2 = []
-    prices3 = []
-    for i in range(15):
-        barrier.append(2.0**i)
-        prices1.append(option.calcPrice(-0.25, 1.0, -0.5, 20, 1, 1, barrier[i]))
-        prices2.append(option.calcPrice(0.0, 1.0, -0.5, 20, 1, 1, barrier[i]))
-        prices3.append(option.calcPrice(0.25, 1.0, -0.5, 20, 1, 1, barrier[i]))
+    barrier = 2.0 ** np.arange(15)
+    rates = np.array([[-0.25], [0.0], [0.25]])
+    prices1, prices2, prices3 = option.calcPriceBatch(rates, 1.0, -0.5, 20, 1, 1, barrier, dtype=np.float32)
     
     plt.plot(barrier, prices1, label="Zins=-0.25")
     plt.plot(barrier, prices2, label="Zins=0.0")
@@ -338,15 +440,9 @@ if __name__ == "__main__":
     
     #Strike-Preis
     option = UICallOption()
-    strike = []
-    prices1 = []
-    prices2 = []
-    prices3 = []
-    for i in range(120):
-        strike.append(i)
-        prices1.append(option.calcPrice(-0.25, 1.0, -0.5, 20, 1, i, 128))
-        prices2.append(option.calcPrice(0.0, 1.0, -0.5, 20, 1, i, 128))
-        prices3.append(option.calcPrice(0.25, 1.0, -0.5, 20, 1, i, 128))
+    strike = np.arange(120)
+    rates = np.array([[-0.25], [0.0], [0.25]])
+    prices1, prices2, prices3 = option.calcPriceBatch(rates, 1.0, -0.5, 20, 1, strike, 128, dtype=np.float32)
     
     plt.plot(strike, prices1, label="Zins=-0.25")
     plt.plot(strike, prices2, label="Zins=0.0")
@@ -360,13 +456,8 @@ if __name__ == "__main__":
     #Zins-Preis
     option = UICallOption()
     interest = np.linspace(-0.49, 0.99, 100)
-    prices1 = []
-    prices2 = []
-    prices3 = []
-    for i in interest:
-        prices1.append(option.calcPrice(i, 1.0, -0.5, 20, 1, 1, 2))
-        prices2.append(option.calcPrice(i, 1.0, -0.5, 20, 1, 1, 16))
-        prices3.append(option.calcPrice(i, 1.0, -0.5, 20, 1, 1,128))
+    barrier = np.array([[2], [16], [128]])
+    prices1, prices2, prices3 = option.calcPriceBatch(interest, 1.0, -0.5, 20, 1, 1, barrier, dtype=np.float32)
     
     plt.plot(interest, prices1, label="Barriere=2")
     plt.plot(interest, prices2, label="Barriere=16")